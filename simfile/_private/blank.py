@@ -0,0 +1,20 @@
+from copy import deepcopy
+from functools import wraps
+from typing import Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+def cached_blank(blank: Callable[[type], T]) -> Callable[[type], T]:
+    # Parse each class's blank template once, then hand out deep copies,
+    # which are much cheaper than running the MSD parser again
+    templates: Dict[type, T] = {}
+
+    @wraps(blank)
+    def cached(cls: type) -> T:
+        template = templates.get(cls)
+        if template is None:
+            template = templates[cls] = blank(cls)
+        return deepcopy(template)
+
+    return cached
@@ -2,10 +2,12 @@ from typing import MutableMapping, Optional
 
 
 def item_property(name, alias=None):
+    if not alias:
+        return _plain_item_property(name)
 
     # Decide whether to use the property's alias instead of its primary name
     def _name_or_alias(self):
-        if name not in self and alias and alias in self:
+        if name not in self and alias in self:
             return alias
         else:
             return name
@@ -23,3 +25,20 @@ def item_property(name, alias=None):
         del self[_name_or_alias(self)]
 
     return item_property
+
+
+def _plain_item_property(name):
+    # Most properties have no alias, so their key can be resolved up front
+    @property
+    def item_property(self: MutableMapping[str, str]) -> Optional[str]:
+        return self.get(name)
+
+    @item_property.setter
+    def item_property(self: MutableMapping[str, str], value: str) -> None:
+        self[name] = value
+
+    @item_property.deleter
+    def item_property(self: MutableMapping[str, str]) -> None:
+        del self[name]
+
+    return item_property
@@ -21,7 +21,8 @@ class AssetDefinition(NamedTuple):
 
     def matches(self, path: str) -> bool:
         root, _ = os.path.splitext(path)
-        if any(re.search(preset, root.lower()) for preset in self.presets):
+        root = root.lower()
+        if any(re.search(preset, root) for preset in self.presets):
             return True
         if self.match_by_extension and extensions.match(path, *self.extensions):
             return True
@@ -8,7 +8,7 @@ the SM and SSC formats.
 from abc import ABCMeta, abstractclassmethod, abstractmethod
 from collections import OrderedDict
 from io import StringIO
-from typing import Iterator, Optional, TextIO, Tuple, Union
+from typing import Iterator, Optional, TextIO, Tuple, Union, cast
 
 from msdparser import parse_msd, MSDParameter
 
@@ -155,8 +155,10 @@ class BaseSimfile(OrderedDict, Serializable, metaclass=ABCMeta):
         # but simfile does for backwards compatibility
         file_for_msdparser = None
         if file:
-            if isinstance(file, TextIO):
-                file_for_msdparser = file
+            if hasattr(file, "read"):
+                # Decode the whole file in one call instead of joining it
+                # line by line (typing.TextIO never matches real files)
+                file_for_msdparser = StringIO(cast(TextIO, file).read())
             else:
                 file_for_msdparser = StringIO("".join(file))
 
@@ -183,13 +185,15 @@ class BaseSimfile(OrderedDict, Serializable, metaclass=ABCMeta):
         """
 
     def serialize(self, file: TextIO):
+        lines = []
         for (key, value) in self.items():
             if key in BaseSimfile.MULTI_VALUE_PROPERTIES:
                 param = MSDParameter((key, *value.split(":")))
             else:
                 param = MSDParameter((key, value))
-            file.write(f"{param}\n")
-        file.write("\n")
+            lines.append(f"{param}\n")
+        lines.append("\n")
+        file.write("".join(lines))
         self.charts.serialize(file)
 
     def __repr__(self) -> str:
@@ -212,8 +216,11 @@ class BaseSimfile(OrderedDict, Serializable, metaclass=ABCMeta):
         Two simfiles are equal if they have the same type, parameters, and
         charts.
         """
+        if self is other:
+            return True
         return (
             type(self) is type(other)
+            and len(self.charts) == len(other.charts)
             and OrderedDict.__eq__(self, other)
             and self.charts == other.charts
         )
@@ -164,14 +164,20 @@ class NoteData:
         if you'd prefer to keep the note data tidy.
         """
         notedata = StringIO()
+        empty_row = "0" * columns + "\n"
 
         # write a row and trailing newline to the notedata
-        def push_row(row: List[Note] = []):
+        def push_row(row: List[Note]):
             note_strings = ["0"] * columns
             for note in row:
                 note_strings[note.column] = str(note)
+            note_strings.append("\n")
             notedata.write("".join(note_strings))
-            notedata.write("\n")
+
+        # write consecutive empty rows with a single write
+        def push_empty_rows(count: int):
+            if count > 0:
+                notedata.write(empty_row * count)
 
         # write a measure to the notedata (no commas or newlines of its own)
         def push_measure(measure: List[Note] = []):
@@ -186,13 +192,11 @@ class NoteData:
             last_row = -1
             for r, row in groupby(measure, lambda note: int(note.beat % 4 * q)):
                 # account for any skipped beats
-                for _ in range(last_row + 1, r):
-                    push_row()
+                push_empty_rows(r - last_row - 1)
                 push_row(list(row))
                 last_row = r
             # account for any trailing empty rows
-            for _ in range(last_row + 1, q * 4):
-                push_row()
+            push_empty_rows(q * 4 - last_row - 1)
 
         # group notes by player (for routine charts)
         last_player = -1
@@ -257,13 +261,20 @@ class NoteData:
 
         for l, line in enumerate(lines):
             line = line.strip()
+            # Most rows are empty, so skip them without visiting each column
+            if not line.strip("0"):
+                continue
             keysound_indices: List[Optional[int]] = [None] * self._columns
-            line = NoteData._extract_keysound_indices(line, keysound_indices)
+            if "[" in line:
+                line = NoteData._extract_keysound_indices(line, keysound_indices)
+
+            # Every note in the row shares the same (immutable) beat
+            beat = Beat(m * 4 * subdivision + l * 4, subdivision)
 
             for c, column in enumerate(line):
                 if column != "0":
                     yield Note(
-                        beat=Beat(m * 4 * subdivision + l * 4, subdivision),
+                        beat=beat,
                         column=c,
                         note_type=NoteType(column),
                         player=p,
@@ -1,3 +1,4 @@
+from operator import attrgetter, countOf
 from typing import FrozenSet, Iterable, Iterator
 
 from . import Note, NoteType
@@ -93,7 +94,7 @@ def count_mines(notes: Iterable[Note]) -> int:
     """
     Count the mines in a note stream.
     """
-    return sum(note.note_type == NoteType.MINE for note in notes)
+    return countOf(map(attrgetter("note_type"), notes), NoteType.MINE)
 
 
 def count_hands(
@@ -176,22 +176,22 @@ def group_notes(
         maybe_head: Optional[Note], maybe_tail: Optional[Note]
     ) -> None:
         if not maybe_head:
-            if orphaned_tail == OrphanedNotes.RAISE_EXCEPTION:
+            if orphaned_tail is OrphanedNotes.RAISE_EXCEPTION:
                 raise OrphanedNoteException(maybe_tail)
-            elif orphaned_tail == OrphanedNotes.KEEP_ORPHAN:
+            elif orphaned_tail is OrphanedNotes.KEEP_ORPHAN:
                 if maybe_tail:
                     buffer.append(maybe_tail)
-            elif orphaned_tail == OrphanedNotes.DROP_ORPHAN:
+            elif orphaned_tail is OrphanedNotes.DROP_ORPHAN:
                 pass  # Do nothing and the tail won't be emitted
             return
         head: Note = maybe_head
 
-        if not maybe_tail or maybe_tail.note_type != NoteType.TAIL:
-            if orphaned_head == OrphanedNotes.RAISE_EXCEPTION:
+        if not maybe_tail or maybe_tail.note_type is not NoteType.TAIL:
+            if orphaned_head is OrphanedNotes.RAISE_EXCEPTION:
                 raise OrphanedNoteException(head)
-            elif orphaned_head == OrphanedNotes.KEEP_ORPHAN:
+            elif orphaned_head is OrphanedNotes.KEEP_ORPHAN:
                 pass  # Do nothing and the head will be emitted as-is
-            elif orphaned_head == OrphanedNotes.DROP_ORPHAN:
+            elif orphaned_head is OrphanedNotes.DROP_ORPHAN:
                 buffer.remove(head)
             else:
                 raise ValueError(orphaned_head)
@@ -207,7 +207,7 @@ def group_notes(
             # In a well-formed chart, these two conditions should always be
             # equal, but we'll let `join_head_to_tail` decide how to handle
             # edge cases with orphaned heads / tails.
-            if note.column in held_columns or note.note_type == NoteType.TAIL:
+            if note.column in held_columns or note.note_type is NoteType.TAIL:
                 head = held_columns.pop(note.column, None)
                 join_head_to_tail(head, note)
                 yield from flush_until_held_note()
@@ -215,7 +215,7 @@ def group_notes(
             if note.note_type in (NoteType.HOLD_HEAD, NoteType.ROLL_HEAD):
                 held_columns[note.column] = note
 
-            if note.note_type != NoteType.TAIL:
+            if note.note_type is not NoteType.TAIL:
                 yield from maybe_buffer(note)
 
         # Clean up orphaned heads
@@ -225,21 +225,24 @@ def group_notes(
         yield from flush()
 
     def add_row(row: List[_NoteMaybeWithTail]) -> Iterator[GroupedNotes]:
-        if same_beat_notes == SameBeatNotes.KEEP_SEPARATE:
+        if same_beat_notes is SameBeatNotes.KEEP_SEPARATE:
             yield from [[note] for note in row]
-        elif same_beat_notes == SameBeatNotes.JOIN_ALL:
+        elif same_beat_notes is SameBeatNotes.JOIN_ALL:
             yield row
-        elif same_beat_notes == SameBeatNotes.JOIN_BY_NOTE_TYPE:
+        elif same_beat_notes is SameBeatNotes.JOIN_BY_NOTE_TYPE:
             joined_note_types = set()
             for note in row:
                 nt = note.note_type
                 if nt in joined_note_types:
                     continue
                 joined_note_types.add(nt)
-                yield list(filter(lambda n: n.note_type == nt, row))
+                yield list(filter(lambda n: n.note_type is nt, row))
 
+    # Enum members hash in Python, but compare by identity in C, so a short
+    # tuple scan beats a frozenset lookup for every note
+    note_types = tuple(include_note_types)
     notes = filter(
-        lambda note: note.note_type in include_note_types,
+        lambda note: note.note_type in note_types,
         notes,
     )
 
@@ -278,11 +281,11 @@ def ungroup_notes(
 
     def check_orphan(note: Note) -> Iterator[Note]:
         if note.column in (t.column for t in pending_tails):
-            if orphaned_notes == OrphanedNotes.RAISE_EXCEPTION:
+            if orphaned_notes is OrphanedNotes.RAISE_EXCEPTION:
                 raise OrphanedNoteException(note)
-            elif orphaned_notes == OrphanedNotes.KEEP_ORPHAN:
+            elif orphaned_notes is OrphanedNotes.KEEP_ORPHAN:
                 pass  # Let the splitting note be yielded below
-            elif orphaned_notes == OrphanedNotes.DROP_ORPHAN:
+            elif orphaned_notes is OrphanedNotes.DROP_ORPHAN:
                 return  # Don't yield the splitting note
         yield note
 
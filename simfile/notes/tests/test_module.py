@@ -3,7 +3,7 @@ import unittest
 
 from .helpers import *
 from .. import *
-from ... import open as open_simfile
+from ...tests.helpers import open_testdata
 from ...timing import Beat
 
 
@@ -186,20 +186,19 @@ class TestNoteData(unittest.TestCase):
         chart.notes = f"{chart.notes}\n&\n{chart.notes}"
         notedata = NoteData(chart)
         notes = list(notedata)
-        first_half = notes[: len(notes)]
-        second_half = notes[len(notes) :]
+        first_half = notes[: len(notes) // 2]
+        second_half = notes[len(notes) // 2 :]
 
         # since we copied the chart for both players, check that every field
         # matches except for the player
-        for note1, note2 in zip(first_half, second_half):
-            self.assertEqual(note1.beat, note2.beat)
-            self.assertEqual(note1.column, note2.column)
-            self.assertEqual(note1.note_type, note2.note_type)
-            self.assertEqual(note1.player, 0)
-            self.assertEqual(note2.player, 1)
+        self.assertListEqual(list(NoteData(testing_chart())), first_half)
+        self.assertListEqual(
+            [note._replace(player=1) for note in first_half],
+            second_half,
+        )
 
     def test_from_chart_and_iter_handle_notes2(self):
-        l9 = open_simfile("testdata/L9/L9.ssc")
+        l9 = open_testdata("L9/L9.ssc")
         chart = l9.charts[0]
 
         notes = list(NoteData(chart))
@@ -270,7 +269,7 @@ class TestNoteData(unittest.TestCase):
         )
 
     def test_notes_assignment_handles_notes2(self):
-        l9 = open_simfile("testdata/L9/L9.ssc")
+        l9 = open_testdata("L9/L9.ssc")
         chart = l9.charts[0]
         notedata = NoteData(chart)
         modified_notedata: NoteData = NoteData.from_notes(
@@ -1,8 +1,8 @@
 from enum import Enum
-from typing import Iterator, NamedTuple
+from typing import Iterator, NamedTuple, Optional
 
 from . import Note, NoteData, NoteType
-from ..timing import TimingData
+from ..timing import Beat, TimingData
 from ..timing.engine import SongTime, TimingEngine
 
 
@@ -47,16 +47,29 @@ def time_notes(
     more details.
     """
     engine = TimingEngine(timing_data)
+    hittable = engine.hittable
+    time_at = engine.time_at
 
+    # Notes on the same beat (jumps, hands, etc.) share their timing, so
+    # only query the engine when the beat changes
+    last_beat: Optional[Beat] = None
     for note in note_data:
-        if engine.hittable(note.beat) or unhittable_notes == UnhittableNotes.KEEP_NOTE:
-            yield TimedNote(time=engine.time_at(note.beat), note=note)
-        elif unhittable_notes == UnhittableNotes.TAP_TO_FAKE:
-            if note.note_type == NoteType.TAP:
+        beat = note.beat
+        if beat != last_beat:
+            last_beat = beat
+            time = time_at(beat)
+            # KEEP_NOTE doesn't care about warps, so skip the engine query
+            is_hittable = (
+                unhittable_notes is UnhittableNotes.KEEP_NOTE or hittable(beat)
+            )
+        if is_hittable:
+            yield TimedNote(time, note)
+        elif unhittable_notes is UnhittableNotes.TAP_TO_FAKE:
+            if note.note_type is NoteType.TAP:
                 yield TimedNote(
-                    time=engine.time_at(note.beat),
+                    time=time,
                     note=Note(
-                        beat=note.beat,
+                        beat=beat,
                         column=note.column,
                         note_type=NoteType.FAKE,
                     ),
@@ -1,11 +1,14 @@
 """
 Simfile & chart classes for SM files.
 """
+import sys
+
 from msdparser import MSDParameter
 from simfile._private.property import item_property
 from typing import Iterator, List, Optional, Sequence, Type
 
 from .base import BaseChart, BaseCharts, BaseSimfile, MSD_ITERATOR
+from ._private.blank import cached_blank
 from ._private.dedent import dedent_and_trim
 
 
@@ -38,6 +41,7 @@ class SMChart(BaseChart):
     """
 
     @classmethod
+    @cached_blank
     def blank(cls: Type["SMChart"]) -> "SMChart":
         return SMChart.from_str(
             dedent_and_trim(
@@ -102,8 +106,9 @@ class SMChart(BaseChart):
                 f"chart components, got {len(values)}"
             )
 
+        # These keys are known to be valid, so skip __setitem__'s check
         for property, value in zip(SM_CHART_PROPERTIES, values):
-            self[property] = value.strip()
+            BaseChart.__setitem__(self, property, value.strip())
 
         if len(values) > len(SM_CHART_PROPERTIES):
             self.extradata = list(values[len(SM_CHART_PROPERTIES) :])
@@ -196,16 +201,20 @@ class SMSimfile(BaseSimfile):
 
     def _parse(self, parser: MSD_ITERATOR):
         self._charts = SMCharts()
+        append_chart = self._charts.append
+        multi_value_properties = BaseSimfile.MULTI_VALUE_PROPERTIES
         for param in parser:
-            key = param.key.upper()
+            # Interned keys let property lookups match by identity
+            key = sys.intern(param.key.upper())
             if key == "NOTES":
-                self.charts.append(SMChart.from_msd(param.components[1:]))
-            elif key in BaseSimfile.MULTI_VALUE_PROPERTIES:
+                append_chart(SMChart.from_msd(param.components[1:]))
+            elif key in multi_value_properties:
                 self[key] = ":".join(param.components[1:])
             else:
                 self[key] = param.value
 
     @classmethod
+    @cached_blank
     def blank(cls: Type["SMSimfile"]) -> "SMSimfile":
         return SMSimfile(
             string=dedent_and_trim(
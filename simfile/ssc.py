@@ -1,11 +1,13 @@
 """
 Simfile & chart classes for SSC files.
 """
+import sys
 from typing import Optional, Sequence, Type
 
 from msdparser import parse_msd, MSDParameter
 
 from .base import BaseChart, BaseCharts, BaseSimfile, MSD_ITERATOR
+from ._private.blank import cached_blank
 from ._private.dedent import dedent_and_trim
 from ._private.property import item_property
 
@@ -70,6 +72,7 @@ class SSCChart(BaseChart):
         return chart
 
     @classmethod
+    @cached_blank
     def blank(cls: Type["SSCChart"]) -> "SSCChart":
         return cls.from_str(
             """
@@ -99,30 +102,36 @@ class SSCChart(BaseChart):
             raise ValueError("expected NOTEDATA property first")
 
         for param in iterator:
-            if param.key in BaseSimfile.MULTI_VALUE_PROPERTIES:
-                self[param.key] = ":".join(param.components[1:])
+            key = sys.intern(param.key.upper())
+            if key in BaseSimfile.MULTI_VALUE_PROPERTIES:
+                self[key] = ":".join(param.components[1:])
             else:
-                self[param.key] = param.value
-            if param.value is self.notes:
+                self[key] = param.value
+            if key in ("NOTES", "NOTES2"):
                 break
 
     def serialize(self, file):
-        file.write(f"{MSDParameter(('NOTEDATA', ''))}\n")
-        notes_key = "NOTES"
+        lines = [f"{MSDParameter(('NOTEDATA', ''))}\n"]
+        # Same resolution as the `notes` property: NOTES2 is only used as
+        # an alias when there's no NOTES property
+        if "NOTES" not in self and "NOTES2" in self:
+            notes_key = "NOTES2"
+        else:
+            notes_key = "NOTES"
 
         for (key, value) in self.items():
             # Either NOTES or NOTES2 must be the last chart property
-            if value is self.notes:
-                notes_key = key
+            if key == notes_key:
                 continue
             if key in BaseSimfile.MULTI_VALUE_PROPERTIES:
                 param = MSDParameter((key, *value.split(":")))
             else:
                 param = MSDParameter((key, value))
-            file.write(f"{param}\n")
+            lines.append(f"{param}\n")
 
         notes_param = MSDParameter((notes_key, self[notes_key]))
-        file.write(f"{notes_param}\n\n")
+        lines.append(f"{notes_param}\n\n")
+        file.write("".join(lines))
 
 
 class SSCCharts(BaseCharts[SSCChart]):
@@ -166,6 +175,7 @@ class SSCSimfile(BaseSimfile):
     fakes = item_property("FAKES")
 
     @classmethod
+    @cached_blank
     def blank(cls: Type["SSCSimfile"]) -> "SSCSimfile":
         return SSCSimfile(
             string=dedent_and_trim(
@@ -215,7 +225,8 @@ class SSCSimfile(BaseSimfile):
         self.charts = SSCCharts()
         partial_chart: Optional[SSCChart] = None
         for param in parser:
-            key = param.key.upper()
+            # Interned keys let property lookups match by identity
+            key = sys.intern(param.key.upper())
             if key in BaseSimfile.MULTI_VALUE_PROPERTIES:
                 value: Optional[str] = ":".join(param.components[1:])
             else:
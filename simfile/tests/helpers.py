@@ -0,0 +1,19 @@
+from copy import deepcopy
+from functools import lru_cache
+import os
+
+import simfile
+from simfile.types import Simfile
+
+
+@lru_cache(maxsize=None)
+def _load_testdata(filename: str) -> Simfile:
+    path = os.path.join("testdata", filename)
+    with open(path, "rb") as file:
+        return simfile.loads(file.read().decode("utf-8"))
+
+
+def open_testdata(filename: str) -> Simfile:
+    # Each fixture is only parsed once per process; callers get a deep copy
+    # that they can safely mutate, which is much cheaper than parsing again
+    return deepcopy(_load_testdata(filename))
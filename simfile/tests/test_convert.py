@@ -1,7 +1,7 @@
 from typing import cast
 import unittest
 
-import simfile
+from .helpers import open_testdata
 from ..sm import SMSimfile
 from ..ssc import SSCSimfile
 from ..convert import *
@@ -9,27 +9,30 @@ from ..convert import *
 
 class TestConvert(unittest.TestCase):
     def test_sm_to_ssc(self):
-        sm = simfile.open("testdata/nekonabe/nekonabe.sm")
+        sm = open_testdata("nekonabe/nekonabe.sm")
         assert isinstance(sm, SMSimfile)
 
         ssc = sm_to_ssc(sm)
 
-        for property, value in sm.items():
-            self.assertEqual(value, ssc[property])
+        self.assertEqual(dict(sm), {property: ssc[property] for property in sm})
         self.assertEqual("0.83", ssc.version)
         self.assertEqual(len(sm.charts), len(ssc.charts))
-        for sm_chart, ssc_chart in zip(sm.charts, ssc.charts):
-            for property, value in sm_chart.items():
-                self.assertEqual(value, ssc_chart[property])
+        self.assertEqual(
+            [dict(sm_chart) for sm_chart in sm.charts],
+            [
+                {property: ssc_chart[property] for property in sm_chart}
+                for sm_chart, ssc_chart in zip(sm.charts, ssc.charts)
+            ],
+        )
 
     def test_ssc_to_sm_raises_by_default(self):
-        ssc = simfile.open("testdata/Springtime/Springtime.ssc")
+        ssc = open_testdata("Springtime/Springtime.ssc")
         assert isinstance(ssc, SSCSimfile)
 
         self.assertRaises(InvalidPropertyException, ssc_to_sm, ssc)
 
     def test_ssc_to_sm_with_lenient_invalid_property_behaviors(self):
-        ssc = simfile.open("testdata/Springtime/Springtime.ssc")
+        ssc = open_testdata("Springtime/Springtime.ssc")
         assert isinstance(ssc, SSCSimfile)
 
         sm = ssc_to_sm(
@@ -46,11 +49,15 @@ class TestConvert(unittest.TestCase):
             else:
                 self.assertEqual(value, ssc[key])
         self.assertEqual(len(ssc.charts), len(sm.charts))
-        for ssc_chart, sm_chart in zip(ssc.charts, sm.charts):
-            # We're iterating over the output sm_chart on purpose:
-            # SMChart cannot accept fields that it doesn't know about
-            for property, value in sm_chart.items():
-                self.assertEqual(value, ssc_chart[property])
+        # We're iterating over the output sm_chart on purpose:
+        # SMChart cannot accept fields that it doesn't know about
+        self.assertEqual(
+            [dict(sm_chart) for sm_chart in sm.charts],
+            [
+                {property: ssc_chart[property] for property in sm_chart}
+                for ssc_chart, sm_chart in zip(ssc.charts, sm.charts)
+            ],
+        )
 
     def test_sm_to_ssc_with_negative_timing_data(self):
         sm = SMSimfile.blank()
@@ -20,6 +20,11 @@ test_encoding_strings = {
 }
 
 
+def read_text(filename: str) -> str:
+    with open(filename, "r") as reader:
+        return reader.read()
+
+
 class TestSimfileModuleWithRealFilesystem(TestCase):
     """
     These tests don't work with pyfakefs because FakeFileWrapper instances
@@ -61,14 +66,14 @@ class TestSimfileModule(TestCase):
             sm = simfile.load(reader)
 
         self.assertIsInstance(sm, SMSimfile)
-        self.assertEqual(SMSimfile(string=test_sm.testing_simfile()), sm)
+        self.assertEqual(test_sm.testing_simfile(), str(sm))
 
     def test_load_with_ssc_extension(self):
         with open("testing_simfile.ssc", "r") as reader:
             ssc = simfile.load(reader)
 
         self.assertIsInstance(ssc, SSCSimfile)
-        self.assertEqual(SSCSimfile(string=test_ssc.testing_simfile()), ssc)
+        self.assertEqual(test_ssc.testing_simfile(), str(ssc))
 
     def test_load_with_stray_text(self):
         with open("straytext.sm", "r") as reader:
@@ -82,13 +87,13 @@ class TestSimfileModule(TestCase):
         sm = simfile.loads(test_sm.testing_simfile())
 
         self.assertIsInstance(sm, SMSimfile)
-        self.assertEqual(SMSimfile(string=test_sm.testing_simfile()), sm)
+        self.assertEqual(test_sm.testing_simfile(), str(sm))
 
     def test_loads_with_ssc_contents(self):
         ssc = simfile.loads(test_ssc.testing_simfile())
 
         self.assertIsInstance(ssc, SSCSimfile)
-        self.assertEqual(SSCSimfile(string=test_ssc.testing_simfile()), ssc)
+        self.assertEqual(test_ssc.testing_simfile(), str(ssc))
 
     def test_loads_with_stray_text(self):
         with open("straytext.sm", "r") as reader:
@@ -106,13 +111,13 @@ class TestSimfileModule(TestCase):
         sm = simfile.open("testing_simfile.sm")
 
         self.assertIsInstance(sm, SMSimfile)
-        self.assertEqual(SMSimfile(string=test_sm.testing_simfile()), sm)
+        self.assertEqual(test_sm.testing_simfile(), str(sm))
 
     def test_open_with_ssc_file(self):
         ssc = simfile.open("testing_simfile.ssc")
 
         self.assertIsInstance(ssc, SSCSimfile)
-        self.assertEqual(SSCSimfile(string=test_ssc.testing_simfile()), ssc)
+        self.assertEqual(test_ssc.testing_simfile(), str(ssc))
 
     def test_open_with_non_ascii_encodings(self):
         for encoding, artist in test_encoding_strings.items():
@@ -235,69 +240,47 @@ class TestSimfileModule(TestCase):
         with simfile.mutate("testing_simfile.sm") as sm:
             sm["TITLE"] = "Cool Song 2"
 
-        sm = simfile.open("testing_simfile.sm")
-
         self.assertEqual("Cool Song 2", sm["TITLE"])
+        self.assertEqual(str(sm), read_text("testing_simfile.sm"))
 
     def test_mutate_with_ssc_file(self):
         with simfile.mutate("testing_simfile.ssc") as ssc:
             ssc["TITLE"] = "Cool Song 2"
 
-        ssc = simfile.open("testing_simfile.ssc")
-
         self.assertEqual("Cool Song 2", ssc["TITLE"])
+        self.assertEqual(str(ssc), read_text("testing_simfile.ssc"))
 
     def test_mutate_with_output_file(self):
-        original_title = None
-        modified_title = "Cool Song 2"
         with simfile.mutate(
             "testing_simfile.ssc",
             output_filename="modified.ssc",
         ) as ssc:
-            original_title = ssc.title
-            ssc.title = modified_title
+            ssc.title = "Cool Song 2"
 
-        ssc = simfile.open("testing_simfile.ssc")
-        self.assertEqual(original_title, ssc.title)
-
-        output_ssc = simfile.open("modified.ssc")
-        self.assertEqual(modified_title, output_ssc.title)
+        self.assertEqual(test_ssc.testing_simfile(), read_text("testing_simfile.ssc"))
+        self.assertEqual(str(ssc), read_text("modified.ssc"))
 
     def test_mutate_with_backup_file(self):
-        original_title = None
-        modified_title = "Cool Song 2"
         with simfile.mutate(
             "testing_simfile.ssc",
             backup_filename="backup.ssc",
         ) as ssc:
-            original_title = ssc.title
-            ssc.title = modified_title
-
-        ssc = simfile.open("testing_simfile.ssc")
-        self.assertEqual(modified_title, ssc.title)
+            ssc.title = "Cool Song 2"
 
-        backup_ssc = simfile.open("backup.ssc")
-        self.assertEqual(original_title, backup_ssc.title)
+        self.assertEqual(str(ssc), read_text("testing_simfile.ssc"))
+        self.assertEqual(test_ssc.testing_simfile(), read_text("backup.ssc"))
 
     def test_mutate_with_output_and_backup_files(self):
-        original_title = None
-        modified_title = "Cool Song 2"
         with simfile.mutate(
             "testing_simfile.ssc",
             output_filename="modified.ssc",
             backup_filename="backup.ssc",
         ) as ssc:
-            original_title = ssc.title
-            ssc.title = modified_title
-
-        ssc = simfile.open("testing_simfile.ssc")
-        self.assertEqual(original_title, ssc.title)
-
-        output_ssc = simfile.open("modified.ssc")
-        self.assertEqual(modified_title, output_ssc.title)
+            ssc.title = "Cool Song 2"
 
-        backup_ssc = simfile.open("backup.ssc")
-        self.assertEqual(original_title, backup_ssc.title)
+        self.assertEqual(test_ssc.testing_simfile(), read_text("testing_simfile.ssc"))
+        self.assertEqual(str(ssc), read_text("modified.ssc"))
+        self.assertEqual(test_ssc.testing_simfile(), read_text("backup.ssc"))
 
     def test_mutate_with_invalid_backup_filename(self):
         backup_matches_input = simfile.mutate(
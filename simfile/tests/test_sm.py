@@ -1,4 +1,5 @@
 from copy import deepcopy
+from functools import lru_cache
 import unittest
 
 from ..sm import *
@@ -30,6 +31,8 @@ def testing_charts():
     return variants
 
 
+# The serialized simfile is immutable, so build it once and share it
+@lru_cache(maxsize=None)
 def testing_simfile():
     sm = SMSimfile.blank()
     sm.title = "My Cool Song"
@@ -109,11 +112,12 @@ class TestSMCharts(unittest.TestCase):
             self.assertIsInstance(chart, SMChart)
 
     def test_serialize(self):
-        unit = SMCharts(testing_charts())
+        charts = testing_charts()
+        unit = SMCharts(charts)
 
         serialized = str(unit)
-        self.assertTrue(serialized.startswith(str(testing_charts()[0])))
-        self.assertTrue(serialized.endswith(str(testing_charts()[-1]) + "\n"))
+        self.assertTrue(serialized.startswith(str(charts[0])))
+        self.assertTrue(serialized.endswith(str(charts[-1]) + "\n"))
 
     def test_repr(self):
         chart = SMChart.from_str(testing_chart())
@@ -128,6 +132,15 @@ class TestSMCharts(unittest.TestCase):
 
 
 class TestSMSimfile(unittest.TestCase):
+    def test_blank_returns_independent_copies(self):
+        first = SMSimfile.blank()
+        first.title = "Changed"
+        first.charts.append(SMChart.blank())
+
+        second = SMSimfile.blank()
+        self.assertEqual("", second.title)
+        self.assertEqual(0, len(second.charts))
+
     def test_init_and_properties(self):
         unit = SMSimfile(string=testing_simfile())
 
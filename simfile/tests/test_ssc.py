@@ -1,4 +1,5 @@
 from copy import deepcopy
+from functools import lru_cache
 import unittest
 
 from ..ssc import *
@@ -39,6 +40,8 @@ def testing_charts():
     return variants
 
 
+# The serialized simfile is immutable, so build it once and share it
+@lru_cache(maxsize=None)
 def testing_simfile():
     ssc = SSCSimfile.blank()
     ssc.version = "0.83"
@@ -82,6 +85,26 @@ class TestSSCChart(unittest.TestCase):
             with_multi_value_properties.attacks,
         )
 
+    def test_init_uppercases_keys(self):
+        unit = SSCChart.from_str(
+            """
+            #NOTEDATA:;
+            #displaybpm:60:240;
+            #notes:
+                0000
+            ;"""
+        )
+        self.assertEqual("60:240", unit.displaybpm)
+        self.assertNotIn("displaybpm", unit)
+
+    def test_serialize_keeps_empty_properties_alongside_empty_notes(self):
+        unit = SSCChart.from_str("#NOTEDATA:;\n#DESCRIPTION:;\n#NOTES:;\n")
+
+        self.assertEqual(
+            "#NOTEDATA:;\n#DESCRIPTION:;\n#NOTES:;\n\n",
+            str(unit),
+        )
+
     def test_serialize(self):
         unit = SSCChart.from_str(testing_chart())
         expected = (
@@ -3,8 +3,9 @@ Timing data classes, plus submodules that operate on timing data.
 """
 from decimal import Decimal
 from fractions import Fraction
+from functools import lru_cache
 from numbers import Rational
-from typing import Any, Optional, Type, NamedTuple, Union
+from typing import Any, Optional, Tuple, Type, NamedTuple, Union
 
 from ._private.timingsource import timing_source
 from simfile._private.generic import ListWithRepr
@@ -18,6 +19,17 @@ MEASURE_SUBDIVISION = 192
 BEAT_SUBDIVISION = MEASURE_SUBDIVISION // 4
 
 
+def _integer_ratio(value: Any) -> Tuple[int, int]:
+    # Decimal parses plain decimal strings much faster than Fraction does
+    if isinstance(value, str):
+        try:
+            return Decimal(value).as_integer_ratio()
+        except (ArithmeticError, ValueError):
+            pass  # e.g. "3/2"; let Fraction parse it or raise the usual error
+    fraction = Fraction(value)
+    return fraction.numerator, fraction.denominator
+
+
 class Beat(Fraction):
     """
     A fractional beat value, denoting vertical position in a simfile.
@@ -36,11 +48,19 @@ class Beat(Fraction):
         numerator: Any = 0,
         denominator: Optional[Union[int, Rational]] = None,
     ):
-        self = super().__new__(cls, numerator, denominator)
-        if denominator or isinstance(numerator, Rational):
-            return self
+        if denominator is not None or isinstance(numerator, Rational):
+            return super().__new__(cls, numerator, denominator)
         else:
-            return self.round_to_tick()
+            # Round the exact value to the nearest tick with integer math,
+            # rather than building an unrounded Beat and rounding that
+            numerator, denominator = _integer_ratio(numerator)
+            ticks, remainder = divmod(numerator * BEAT_SUBDIVISION, denominator)
+            # Round half to even, same as round() on a Fraction
+            if remainder * 2 > denominator or (
+                remainder * 2 == denominator and ticks % 2
+            ):
+                ticks += 1
+            return super().__new__(cls, ticks, BEAT_SUBDIVISION)
 
     @classmethod
     def tick(cls) -> "Beat":
@@ -54,7 +74,7 @@ class Beat(Fraction):
         """
         Convert a decimal string to a beat, rounding to the nearest tick.
         """
-        return Beat(beat_str).round_to_tick()
+        return _beat_from_str(beat_str)
 
     def round_to_tick(self) -> "Beat":
         """
@@ -138,6 +158,13 @@ class Beat(Fraction):
         return Beat(super().__truediv__(other))
 
 
+# Timing strings repeat the same beats a lot (within BPMS/STOPS/etc. and
+# across charts), and beats are immutable, so parsed values can be shared
+@lru_cache(maxsize=4096)
+def _beat_from_str(beat_str: str) -> Beat:
+    return Beat(beat_str)
+
+
 class BeatValue(NamedTuple):
     """
     An event that occurs on a particular beat, e.g. a BPM change or stop.
@@ -170,9 +197,11 @@ class BeatValues(ListWithRepr[BeatValue]):
         instance = cls()
 
         if string and string.strip():
+            append = instance.append
+            beat_from_str = Beat.from_str
             for row in string.split(","):
                 beat, value = row.strip().split("=")
-                instance.append(BeatValue(Beat.from_str(beat), Decimal(value)))
+                append(BeatValue(beat_from_str(beat), Decimal(value)))
 
         return instance
 
@@ -180,7 +209,7 @@ class BeatValues(ListWithRepr[BeatValue]):
         """
         Convert the beat-value pairs to their MSD value representation.
         """
-        return ",\n".join(f"{event.beat}={event.value}" for event in self)
+        return ",\n".join([f"{event.beat}={event.value}" for event in self])
 
 
 class TimingData:
@@ -199,6 +228,8 @@ class TimingData:
     offset does get used intentionally from time to time.)
     """
 
+    __slots__ = ("bpms", "stops", "delays", "warps", "offset")
+
     bpms: BeatValues
     stops: BeatValues
     delays: BeatValues
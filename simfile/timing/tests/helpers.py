@@ -1,5 +1,6 @@
 from .. import TimingData
-from simfile.ssc import SSCSimfile
+from ...ssc import SSCSimfile
+from ...tests.helpers import open_testdata
 
 
 def testing_timing_data():
@@ -3,25 +3,25 @@ import unittest
 
 from simfile.sm import SMSimfile
 
+from .helpers import open_testdata
 from ..displaybpm import *
-import simfile
 
 
 class TestDisplayBPM(unittest.TestCase):
     def test_static_value(self):
-        springtime = simfile.open("testdata/Springtime/Springtime.ssc")
+        springtime = open_testdata("Springtime/Springtime.ssc")
         result = displaybpm(springtime)
         self.assertEqual(StaticDisplayBPM(value=Decimal("182")), result)
         self.assertEqual("182", str(result))
 
     def test_ssc_chart_and_static_value(self):
-        springtime = simfile.open("testdata/Springtime/Springtime.ssc")
+        springtime = open_testdata("Springtime/Springtime.ssc")
         result = displaybpm(springtime, springtime.charts[0])
         self.assertEqual(StaticDisplayBPM(value=Decimal("182")), result)
         self.assertEqual("182", str(result))
 
     def test_range_value(self):
-        springtime = simfile.open("testdata/Springtime/Springtime.ssc")
+        springtime = open_testdata("Springtime/Springtime.ssc")
         del springtime["DISPLAYBPM"]
         del springtime.charts[0]["DISPLAYBPM"]
         result = displaybpm(springtime, springtime.charts[0])
@@ -32,7 +32,7 @@ class TestDisplayBPM(unittest.TestCase):
         self.assertEqual("91:182", str(result))
 
     def test_random_value(self):
-        springtime = simfile.open("testdata/Springtime/Springtime.ssc")
+        springtime = open_testdata("Springtime/Springtime.ssc")
         springtime.displaybpm = "*"
         result = displaybpm(springtime)
         self.assertEqual(RandomDisplayBPM(), result)
@@ -60,7 +60,7 @@ class TestDisplayBPM(unittest.TestCase):
         self.assertEqual(StaticDisplayBPM(Decimal(120)), result)
 
     def test_ignore_specified(self):
-        springtime = simfile.open("testdata/Springtime/Springtime.ssc")
+        springtime = open_testdata("Springtime/Springtime.ssc")
         result = displaybpm(springtime, springtime.charts[0], ignore_specified=True)
         self.assertEqual(
             RangeDisplayBPM(min=Decimal("90.843"), max=Decimal("181.685")),
@@ -1,9 +1,8 @@
 from decimal import Decimal
 import unittest
 
-import simfile
 from simfile.ssc import SSCSimfile
-from .helpers import testing_timing_data
+from .helpers import open_testdata, testing_timing_data
 from .. import *
 
 
@@ -20,6 +19,16 @@ class TestBeat(unittest.TestCase):
         self.assertEqual(Beat(4, 12), Beat.from_str("0.333"))
         self.assertEqual(Beat(4, 8), Beat.from_str("0.500"))
 
+    def test_init_rounds_to_tick(self):
+        self.assertEqual(Beat(1, 48), Beat("0.0208"))
+        self.assertEqual(Beat(-1, 48), Beat("-0.0208"))
+        self.assertEqual(Beat(2, 48), Beat("0.052083333333333333333333333333"))
+        # Exact half ticks round to the even tick, like round()
+        self.assertEqual(Beat(2, 48), Beat("0.03125"))
+        self.assertEqual(Beat(5, 48), Beat(0.1))
+        self.assertEqual(Beat(3, 2), Beat("3/2"))
+        self.assertRaises(ValueError, Beat, "beat")
+
     def test_str(self):
         self.assertEqual("0.000", str(Beat(0, 1)))
         self.assertEqual("12.333", str(Beat(37, 3)))
@@ -123,7 +132,7 @@ class TestTimingData(unittest.TestCase):
         self.assertEqual(Decimal("-0.009"), timing_data.offset)
 
     def test_constructor_with_ssc_chart_without_distinct_timing_data(self):
-        ssc = simfile.open("testdata/Springtime/Springtime.ssc")
+        ssc = open_testdata("Springtime/Springtime.ssc")
         ssc_chart = next(
             filter(
                 lambda c: c.stepstype == "pump-single" and c.difficulty == "Hard",
@@ -137,7 +146,7 @@ class TestTimingData(unittest.TestCase):
         self.assertEqual(Decimal(ssc.offset), timing_data.offset)  # type: ignore
 
     def test_constructor_with_ssc_chart_with_distinct_timing_data(self):
-        ssc = simfile.open("testdata/Springtime/Springtime.ssc")
+        ssc = open_testdata("Springtime/Springtime.ssc")
         ssc_chart = next(
             filter(
                 lambda c: c.stepstype == "pump-single" and c.difficulty == "Challenge",
@@ -151,7 +160,7 @@ class TestTimingData(unittest.TestCase):
         self.assertEqual(Decimal(ssc_chart["OFFSET"]), timing_data.offset)
 
     def test_constructor_with_ssc_chart_but_too_old_version(self):
-        ssc = simfile.open("testdata/Springtime/Springtime.ssc")
+        ssc = open_testdata("Springtime/Springtime.ssc")
         assert isinstance(ssc, SSCSimfile)
         ssc.version = "0.69"
         ssc_chart = next(
@@ -165,7 +174,7 @@ class TestTimingData(unittest.TestCase):
         self.assertEqual(BeatValues.from_str(ssc.stops), timing_data.stops)
 
     def test_handles_omitted_offset(self):
-        sm = simfile.open("testdata/nekonabe/nekonabe.sm")
+        sm = open_testdata("nekonabe/nekonabe.sm")
         del sm["OFFSET"]
         timing_data = TimingData(sm)
         self.assertEqual(Decimal(0), timing_data.offset)